@@ -94,6 +94,8 @@ class ConfigNamespace:
     or :mod:`staticconf.schema`.
     """
 
+    __slots__ = ['name', 'configuration_values', 'value_proxies', '__weakref__']
+
     def __init__(self, name: str) -> None:
         self.name = name
         self.configuration_values: Dict[str, Any] = {}
@@ -251,7 +253,10 @@ def validate(name: str = DEFAULT, all_names: bool = False) -> None:
     :type  all_names: boolean
     """
     for namespace in get_namespaces_from_names(name, all_names):
-        all(value_proxy.get_value() for value_proxy in namespace.get_value_proxies())
+        # A plain loop, not all(): a falsy value would short-circuit and
+        # leave the remaining proxies unvalidated and their caches cold
+        for value_proxy in namespace.get_value_proxies():
+            value_proxy.get_value()
 
 
 class ConfigHelp:
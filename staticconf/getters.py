@@ -69,7 +69,9 @@ from staticconf.validation import Validator
 from staticconf.proxy import ValueProxy
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import Optional
+from typing import Tuple
 
 
 def register_value_proxy(
@@ -84,6 +86,22 @@ def register_value_proxy(
         namespace.get_name(), help_text)
 
 
+def register_value_proxies(
+    namespace: ConfigNamespace,
+    proxies_with_help: Iterable[Tuple[ValueProxy, Optional[str]]],
+) -> None:
+    """Register many value proxies with the namespace in one call, with the
+    per-proxy lookups hoisted out of the loop.
+    """
+    register_proxy = namespace.register_proxy
+    add_help = config.config_help.add
+    namespace_name = namespace.get_name()
+    for value_proxy, help_text in proxies_with_help:
+        register_proxy(value_proxy)
+        add_help(value_proxy.config_key, value_proxy.validator,
+                 value_proxy.default, namespace_name, help_text)
+
+
 class ProxyFactory:
     """Create ValueProxy objects so that there is never a duplicate
     proxy for any (namespace, validator, config_key, default) group.
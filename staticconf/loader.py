@@ -82,18 +82,24 @@ configuration values.
 
 
 """
-import configparser
+import contextlib
+import functools
 import logging
 import importlib
 import os
 import re
+import sys
+import types
 from typing import Any
 from typing import Callable
+from typing import ContextManager
 from typing import Dict
+from typing import IO
 from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Union
 
 from staticconf import config, errors
 
@@ -117,16 +123,80 @@ log = logging.getLogger(__name__)
 
 ConfigDict = Dict[str, Any]
 ConfigLoader = Callable[..., ConfigDict]
+PathOrStream = Union[str, IO[str]]
 
 
-def flatten_dict(config_data: ConfigDict) -> Iterator[Tuple[str, Any]]:
-    for key, value in config_data.items():
-        if hasattr(value, 'items') or hasattr(value, 'iteritems'):
-            for k, v in flatten_dict(value):
-                yield '{}.{}'.format(key, k), v
-            continue
+def open_source(source: PathOrStream) -> ContextManager[IO[str]]:
+    """Return a context manager which yields an open file handle. `source`
+    may be a path or an already open file-like object.
+    """
+    if isinstance(source, str):
+        return open(source)
+    return contextlib.nullcontext(source)
+
+
+# Parsed files keyed by path, invalidated on mtime or size change
+_parse_cache: Dict[Any, Tuple[Tuple[int, int], ConfigDict]] = {}
+
+
+def _cached_parse(
+    parse_func: Callable[[PathOrStream], ConfigDict],
+    source: PathOrStream,
+    *key_extras: Any,
+) -> ConfigDict:
+    if not isinstance(source, str):
+        return parse_func(source)
+
+    stbuf = os.stat(source)
+    signature = (stbuf.st_mtime_ns, stbuf.st_size)
+    key = (source,) + key_extras
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
+    config_data = parse_func(source)
+    _parse_cache[key] = (signature, config_data)
+    # Callers always get a fresh dict; mutating a returned config must not
+    # poison the cache entry
+    return dict(config_data)
+
+
+def clear_cache() -> None:
+    """Clear memoized parse results. Useful for tests which rewrite a config
+    file without changing its mtime and size.
+
+    The cache trusts ``(st_mtime_ns, st_size)``: on filesystems with
+    unreliable mtimes (the case :class:`staticconf.config.MD5Comparator`
+    exists for), a content change that preserves both can be served stale
+    until this is called.
+    """
+    _parse_cache.clear()
+    _python_module_cache.clear()
 
-        yield key, value
+
+def flatten_dict(config_data: ConfigDict) -> Iterator[Tuple[str, Any]]:
+    # A LIFO stack of (prefix, items-iterator) frames keeps the original
+    # recursive depth-first yield order, which decides the winner when a
+    # literal dotted key collides with a nested path. Keys are Any, not
+    # str: parsers such as yaml can produce non-string keys, which are
+    # passed through unmodified.
+    stack: List[Tuple[Any, Iterator[Tuple[Any, Any]]]] = \
+        [('', iter(config_data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            dotted_key = f'{prefix}.{key}' if prefix else key
+            if hasattr(value, 'items') or hasattr(value, 'iteritems'):
+                stack.append((dotted_key, iter(value.items())))
+                break
+            if isinstance(dotted_key, str):
+                # Interned keys turn namespace dict lookups into identity
+                # comparisons on the common path
+                yield sys.intern(dotted_key), value
+            else:
+                yield dotted_key, value
+        else:
+            stack.pop()
 
 
 def load_config_data(
@@ -153,7 +223,7 @@ def build_loader(loader_func: ConfigLoader) -> ConfigLoader:
         name                = kwargs.pop('namespace', config.DEFAULT)
 
         config_data = load_config_data(loader_func, *args, **kwargs)
-        if flatten:
+        if flatten and not getattr(loader_func, 'already_flat', False):
             config_data = dict(flatten_dict(config_data))
         namespace   = config.get_namespace(name)
         namespace.apply_config_data(
@@ -167,42 +237,67 @@ def build_loader(loader_func: ConfigLoader) -> ConfigLoader:
     return loader
 
 
-def yaml_loader(filename: str) -> ConfigDict:
+# Resolved on first use so importing staticconf doesn't import yaml
+_yaml_safe_loader: Any = None
+
+
+def yaml_loader(filename: PathOrStream) -> ConfigDict:
+    global _yaml_safe_loader
     import yaml
-    try:
-        from yaml import CSafeLoader as SafeLoader
-    except ImportError:
-        from yaml import SafeLoader  # type: ignore
 
-    with open(filename) as fh:
-        return yaml.load(fh, Loader=SafeLoader) or {}
+    if _yaml_safe_loader is None:
+        # The C scanner/parser is several times faster when libyaml is built
+        _yaml_safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
+    def parse(source: PathOrStream) -> ConfigDict:
+        with open_source(source) as fh:
+            return yaml.load(fh, Loader=_yaml_safe_loader) or {}
 
-def json_loader(filename: str) -> ConfigDict:
-    try:
-        import simplejson as json
-        assert json
-    except ImportError:
-        import json  # type: ignore
-    with open(filename) as fh:
-        return json.load(fh)
+    return _cached_parse(parse, filename)
+
+
+# Fastest available json decoder, resolved on first use
+_json_loads: Optional[Callable[[Any], Any]] = None
+
+
+def json_loader(filename: PathOrStream) -> ConfigDict:
+    global _json_loads
+    if _json_loads is None:
+        for module_name in ('orjson', 'ujson', 'simplejson', 'json'):
+            try:
+                _json_loads = importlib.import_module(module_name).loads
+                break
+            except ImportError:
+                continue
+    assert _json_loads is not None
+
+    def parse(source: PathOrStream) -> ConfigDict:
+        with open_source(source) as fh:
+            return _json_loads(fh.read())
+
+    return _cached_parse(parse, filename)
 
 
 def list_loader(seq: List[str]) -> ConfigDict:
-    return dict(pair.split('=', 1) for pair in seq)
+    config_dict = {}
+    for pair in seq:
+        key, sep, value = pair.partition('=')
+        if not sep:
+            msg = "Invalid override, expected key=value: %s" % pair
+            raise errors.ConfigurationError(msg)
+        config_dict[sys.intern(key)] = value
+    return config_dict
+
+
+# Emits key=value pairs as-is, no nesting to flatten
+list_loader.already_flat = True  # type: ignore[attr-defined]
 
 
 def auto_loader(
     base_dir: str = '.',
     auto_configurations: Optional[List[Tuple[ConfigLoader, str]]] = None
 ) -> ConfigDict:
-    auto_configurations = auto_configurations or [
-        (yaml_loader,       'config.yaml'),
-        (json_loader,       'config.json'),
-        (ini_file_loader,   'config.ini'),
-        (xml_loader,        'config.xml'),
-        (properties_loader, 'config.properties')
-    ]
+    auto_configurations = auto_configurations or _default_auto_configurations
 
     for config_loader, config_arg in auto_configurations:
         path = os.path.join(base_dir, config_arg)
@@ -212,38 +307,96 @@ def auto_loader(
     raise errors.ConfigurationError(msg)
 
 
+# Loaded module values keyed by module name, invalidated by source mtime
+_python_module_cache: Dict[str, Tuple[float, ConfigDict]] = {}
+
+
 def python_loader(module_name: str) -> ConfigDict:
     module = __import__(module_name, fromlist=['*'])
+    module_file = module.__file__
+    assert module_file is not None
+    mtime = os.path.getmtime(module_file)
+    cached = _python_module_cache.get(module_name)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
     importlib.reload(module)
-    return object_loader(module)
+    config_data = object_loader(module)
+    _python_module_cache[module_name] = (mtime, config_data)
+    # Callers always get a fresh dict; mutating a returned config must not
+    # poison the cache entry
+    return dict(config_data)
 
 
 def object_loader(obj: Any) -> ConfigDict:
-    return {name: getattr(obj, name)
-            for name in dir(obj) if not name.startswith('_')}
+    # Classes and modules can be read straight from their __dict__, which
+    # skips the descriptor protocol that dir() + getattr() would trigger
+    # for every inherited attribute
+    if isinstance(obj, type):
+        attributes: ConfigDict = {}
+        for klass in reversed(obj.__mro__):
+            attributes.update(vars(klass))
+    elif isinstance(obj, types.ModuleType):
+        attributes = vars(obj)
+    else:
+        return {name: getattr(obj, name)
+                for name in dir(obj) if not name.startswith('_')}
+    return {name: value
+            for name, value in attributes.items() if not name.startswith('_')}
+
+
+def ini_file_loader(filename: PathOrStream) -> ConfigDict:
+    return _cached_parse(_parse_ini_file, filename)
+
+
+# Keys are already emitted in section.key form
+ini_file_loader.already_flat = True  # type: ignore[attr-defined]
+
 
+def _parse_ini_file(source: PathOrStream) -> ConfigDict:
+    import configparser
 
-def ini_file_loader(filename: str) -> ConfigDict:
     parser = configparser.ConfigParser()
-    parser.read([filename])
+    with open_source(source) as fh:
+        parser.read_string(fh.read())
     config_dict = {}
 
     for section in parser.sections():
         for key, value in parser.items(section, True):
-            config_dict['{}.{}'.format(section, key)] = value
+            config_dict[sys.intern(f'{section}.{key}')] = value
 
     return config_dict
 
 
-def xml_loader(filename: str, safe: bool = False) -> ConfigDict:
-    from xml.etree import ElementTree
+def xml_loader(filename: PathOrStream, safe: bool = False) -> ConfigDict:
+    return _cached_parse(
+        functools.partial(_parse_xml, safe=safe), filename, safe)
 
-    def build_from_element(element: ElementTree.Element) -> Dict[str, Any]:
-        items: Dict[str, Any] = dict(element.items())
-        child_items = {
-            child.tag: build_from_element(child)
-            for child in element}
 
+def _parse_xml(filename: PathOrStream, safe: bool = False) -> ConfigDict:
+    try:
+        # lxml parses in C and lets us turn off entity expansion outright
+        from lxml import etree  # type: ignore
+        events = etree.iterparse(
+            filename,
+            events=('start', 'end'),
+            resolve_entities=False,
+            remove_comments=True,
+            huge_tree=False,
+        )
+    except ImportError:
+        from xml.etree import ElementTree
+        events = ElementTree.iterparse(filename, events=('start', 'end'))
+
+    # Build the config dict from iterparse events instead of a full DOM,
+    # clearing each element once it's consumed so memory stays O(depth)
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    root_items: Dict[str, Any] = {}
+    for event, element in events:
+        if event == 'start':
+            stack.append((dict(element.items()), {}))
+            continue
+
+        items, child_items = stack.pop()
         config.has_duplicate_keys(child_items, items, safe)
         items.update(child_items)
         if element.text:
@@ -251,14 +404,41 @@ def xml_loader(filename: str, safe: bool = False) -> ConfigDict:
                 msg = "%s has tag with child or attribute named value."
                 raise errors.ConfigurationError(msg % filename)
             items['value'] = element.text
-        return items
-
-    tree = ElementTree.parse(filename)
-    return build_from_element(tree.getroot())
-
-
-def properties_loader(filename: str) -> ConfigDict:
-    split_pattern = re.compile(r'[=:]')
+        tag = element.tag
+        element.clear()
+        if stack:
+            stack[-1][1][tag] = items
+        else:
+            root_items = items
+    return root_items
+
+
+# Compiled once; properties files can have thousands of lines. The comment
+# lookahead is anchored at the line start so backtracking over the leading
+# whitespace cannot sneak past it.
+_properties_split_pattern = re.compile(r'[=:]')
+_properties_line_pattern = re.compile(
+    r'(?m)^(?![ \t]*#)[ \t]*([^=:\n]*?)[ \t]*[:=][ \t]*(.*?)[ \t\r]*$')
+_properties_candidate_pattern = re.compile(r'(?m)^(?![ \t]*#)[ \t]*\S')
+
+
+def properties_loader(filename: PathOrStream) -> ConfigDict:
+    with open_source(filename) as fh:
+        data = fh.read()
+
+    # One C-level scan over the whole buffer; fall back to the line-by-line
+    # parser unless exactly the non-blank, non-comment lines matched, so
+    # invalid lines raise the same error as before. Comparing match
+    # positions (not counts) means a spurious match can't cancel out a
+    # missed line.
+    matches = list(_properties_line_pattern.finditer(data))
+    candidates = _properties_candidate_pattern.finditer(data)
+    if [m.start() for m in matches] == [c.start() for c in candidates]:
+        return {m[1]: m[2] for m in matches}
+    return _parse_properties_lines(data.splitlines())
+
+
+def _parse_properties_lines(lines: List[str]) -> ConfigDict:
 
     def parse_line(line: str) -> Optional[Tuple[str, str]]:
         line = line.strip()
@@ -266,14 +446,22 @@ def properties_loader(filename: str) -> ConfigDict:
             return None
 
         try:
-            key, value = split_pattern.split(line, 1)
+            key, value = _properties_split_pattern.split(line, 1)
         except ValueError:
             msg = "Invalid properties line: %s" % line
             raise errors.ConfigurationError(msg)
         return key.strip(), value.strip()
 
-    with open(filename) as fh:
-        return dict(filter(None, (parse_line(line) for line in fh)))
+    return dict(filter(None, (parse_line(line) for line in lines)))
+
+
+_default_auto_configurations = [
+    (yaml_loader,       'config.yaml'),
+    (json_loader,       'config.json'),
+    (ini_file_loader,   'config.ini'),
+    (xml_loader,        'config.xml'),
+    (properties_loader, 'config.properties'),
+]
 
 
 class CompositeConfiguration:
@@ -288,7 +476,10 @@ class CompositeConfiguration:
         self.loaders.append(loader)
 
     def load(self) -> ConfigDict:
-        output = {}
+        # Must stay sequential: each entry is a built loader whose real
+        # effect is writing into its namespace, so running them concurrently
+        # would apply overrides in thread-completion order
+        output: ConfigDict = {}
         for loader_with_args in self.loaders:
             output.update(loader_with_args[0](*loader_with_args[1:]))
         return output
@@ -4,9 +4,11 @@ values can be read statically at import time.
 """
 import functools
 import operator
+import sys
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Dict
 from typing import Type
 from typing import TypeVar
 from typing import TYPE_CHECKING
@@ -66,18 +68,27 @@ unary_funcs = {
 
 
 def build_class_def(cls: Type["ValueProxy"]) -> type:
-    def build_method(name: str) -> Callable[["ValueProxy", Any, Any], Any]:
-        def method(self: "ValueProxy", *args: Any, **kwargs: Any) -> Any:
-            if name in unary_funcs:
-                return unary_funcs[name](self.value)
-
-            if hasattr(operator, name):
-                return getattr(operator, name)(self.value, *args)
-
-            return getattr(self.value, name)(*args, **kwargs)
+    def build_method(name: str) -> Callable[..., Any]:
+        # Resolve the delegation target once at class-creation time instead
+        # of re-branching on every proxied call
+        if name in unary_funcs:
+            unary_func = unary_funcs[name]
+
+            def method(self: "ValueProxy", *args: Any, **kwargs: Any) -> Any:
+                return unary_func(self.value)
+        elif hasattr(operator, name):
+            operator_func = getattr(operator, name)
+
+            def method(self: "ValueProxy", *args: Any, **kwargs: Any) -> Any:
+                return operator_func(self.value, *args)
+        else:
+            def method(self: "ValueProxy", *args: Any, **kwargs: Any) -> Any:
+                return getattr(self.value, name)(*args, **kwargs)
         return method
 
-    namespace = {name: build_method(name) for name in _special_names}
+    namespace: Dict[str, Any] = {name: build_method(name) for name in _special_names}
+    # Without this the generated subclass would re-grow a per-instance dict
+    namespace['__slots__'] = ()
     return type(cls.__name__, (cls,), namespace)
 
 
@@ -90,7 +101,7 @@ def cache_as_field(cache_name: str) -> Callable[[F], F]:
         @functools.wraps(func)
         def inner_wrapper(self: object, *args: Any, **kwargs: Any) -> Any:
             value = getattr(self, cache_name, UndefToken)
-            if value != UndefToken:
+            if value is not UndefToken:
                 return value
 
             ret = func(self, *args, **kwargs)
@@ -147,7 +158,8 @@ class ValueProxy:
         default: Any = UndefToken,
     ) -> None:
         self.validator      = validator
-        self.config_key     = key
+        # Interned to match the keys produced by loader.flatten_dict
+        self.config_key     = sys.intern(key) if isinstance(key, str) else key
         self.default        = default
         self.namespace      = namespace
         self._value         = UndefToken
@@ -139,6 +139,10 @@ def build_reader(
     :param reader_namespace: the default namespace to use. Defaults to
                              `DEFAULT`.
     """
+    # Bound once here so each read skips the module attribute lookup, and
+    # _read_config is inlined below to avoid a function call per read
+    get_namespace = config.get_namespace
+
     class Reader(ConfigGetValue):
         def __call__(
             self,
@@ -147,8 +151,13 @@ def build_reader(
             namespace: Optional[str] = None,
             unsued: Optional[str] = None,
         ) -> ValueProxy:
-            config_namespace = config.get_namespace(namespace or reader_namespace)
-            return validator(_read_config(config_key, config_namespace, default))
+            config_namespace = get_namespace(namespace or reader_namespace)
+            value = config_namespace.get(config_key, default=default)
+            if value is UndefToken:
+                msg = '{} missing value for {}'.format(
+                    config_namespace, config_key)
+                raise errors.ConfigurationError(msg)
+            return validator(value)
     return Reader()
 
 
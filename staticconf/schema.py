@@ -119,6 +119,10 @@ class ValueTypeDefinition:
 
 
 class ValueToken(ValueProxy):
+    # Keep instances on the slots defined by ValueProxy; without this each
+    # token would re-grow a per-instance dict
+    __slots__ = ()
+
     @classmethod
     def from_definition(
         cls,
@@ -141,7 +145,13 @@ def build_property(value_token: ValueToken) -> property:
     """Construct a property from a ValueToken. The callable gets passed an
     instance of the schema class, which is ignored.
     """
+    # The token is bound in the closure and its cached value is returned
+    # directly, so a warm read costs one slot load instead of going through
+    # the cache_as_field wrapper around get_value
     def caller(_: Any) -> Any:
+        value = value_token._value
+        if value is not proxy.UndefToken:
+            return value
         return value_token.get_value()
     return property(caller)
 
@@ -177,6 +187,7 @@ class SchemaMeta(type):
         """
         config_path = attributes.get('config_path')
         tokens = {}
+        tokens_with_help = []
 
         def build_config_key(value_def: ValueTypeDefinition, config_key: str) -> str:
             key = value_def.config_key or config_key
@@ -189,7 +200,7 @@ class SchemaMeta(type):
             config_key = build_config_key(value_def, name)
             value_token = ValueToken.from_definition(
                                             value_def, namespace, config_key)
-            getters.register_value_proxy(namespace, value_token, value_def.help)
+            tokens_with_help.append((value_token, value_def.help))
             tokens[name] = value_token
             return name, build_property(value_token)
 
@@ -200,7 +211,12 @@ class SchemaMeta(type):
 
         attributes = dict(build_attr(*item)
                           for item in attributes.items())
+        getters.register_value_proxies(namespace, tokens_with_help)
         attributes['_tokens'] = tokens
+        # Schema state lives on the tokens, so instances don't need a
+        # __dict__; a schema that wants instance attributes can still
+        # declare its own __slots__
+        attributes.setdefault('__slots__', ())
         return attributes
 
 
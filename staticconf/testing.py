@@ -9,6 +9,38 @@ from typing import Optional
 from staticconf import config, loader
 
 
+# Flattened config keyed by frozen input, so a context manager built with
+# the same literal dict in every test flattens it only once
+_flatten_cache: Dict[Any, Dict[str, Any]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Build a hashable key from a config dict. Raises TypeError for
+    unhashable leaf values, in which case the result is not cacheable.
+
+    Dicts are tagged and keys and leaves carry their type, so values that
+    compare equal but differ semantically ({'a': 1} vs {'a': True},
+    {1: 'a'} vs {True: 'a'}, or a frozenset leaf vs a nested dict) cannot
+    share a cache entry.
+    """
+    if isinstance(value, dict):
+        return 'dict', frozenset(
+            ((key.__class__, key), _freeze(val)) for key, val in value.items())
+    hash(value)
+    return value.__class__, value
+
+
+def _flatten(config_data: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        cache_key = _freeze(config_data)
+    except TypeError:
+        return dict(loader.flatten_dict(config_data))
+
+    if cache_key not in _flatten_cache:
+        _flatten_cache[cache_key] = dict(loader.flatten_dict(config_data))
+    return _flatten_cache[cache_key]
+
+
 class MockConfiguration:
     """A context manager which replaces the configuration namespace
     while inside the context. When the context exits the old configuration
@@ -39,23 +71,22 @@ class MockConfiguration:
         flatten             = kwargs.pop('flatten', True)
         config_data         = dict(*args, **kwargs)
         self.namespace      = config.get_namespace(name)
-        self.config_data    = (dict(loader.flatten_dict(config_data)) if flatten
+        self.config_data    = (_flatten(config_data) if flatten
                               else config_data)
         self.old_values: Optional[Dict[str, Any]] = None
 
     def setup(self) -> None:
-        self.old_values = dict(self.namespace.get_config_values())
-        self.reset_namespace(self.config_data)
+        # Swap the values dict wholesale rather than copying; the saved
+        # dict is re-bound on teardown so it is never mutated
+        self.old_values = self.namespace.configuration_values
+        self.namespace.configuration_values = dict(self.config_data)
         config.reload(name=self.namespace.name)
 
     def teardown(self) -> None:
-        self.reset_namespace(self.old_values)
+        assert self.old_values is not None
+        self.namespace.configuration_values = self.old_values
         config.reload(name=self.namespace.name)
 
-    def reset_namespace(self, new_values: Optional[Dict[str, Any]]) -> None:
-        self.namespace.configuration_values.clear()
-        self.namespace.update_values(new_values)
-
     def __enter__(self) -> None:
         return self.setup()
 
@@ -88,8 +119,11 @@ class PatchConfiguration(MockConfiguration):
     """
 
     def setup(self) -> None:
-        self.old_values = copy.deepcopy(dict(self.namespace.get_config_values()))
+        # Deep copies, unlike MockConfiguration: the patched namespace keeps
+        # exposing the old mutable values, so in-context mutation must not
+        # leak into the config restored on teardown
+        self.old_values = copy.deepcopy(self.namespace.configuration_values)
         new_configuration = copy.deepcopy(self.old_values)
         new_configuration.update(self.config_data)
-        self.reset_namespace(new_configuration)
+        self.namespace.configuration_values = new_configuration
         config.reload(name=self.namespace.name)
@@ -5,6 +5,7 @@ These functions are used by :mod:`staticconf.readers` and
 :mod:`staticconf.schema` to coerce config values to a type.
 """
 import datetime
+import functools
 import logging
 import re
 import time
@@ -27,26 +28,36 @@ T = TypeVar("T")
 
 
 def validate_string(value: Any) -> Optional[str]:
-    return None if value is None else str(value)
+    if value is None:
+        return None
+    return value if type(value) is str else str(value)
 
 
 def validate_bool(value: Any) -> Optional[bool]:
     return None if value is None else bool(value)
 
 
-def validate_numeric(type_func: Callable[[Any], float], value: Any) -> float:
-    try:
-        return type_func(value)
-    except ValueError:
-        raise ValidationError(f"Invalid {type_func.__name__}: {value}")
-
-
-def validate_int(value: Any) -> float:
-    return validate_numeric(int, value)
+def _build_numeric_validator(type_func: Callable[[Any], float]) -> Validator:
+    """Build a validator which calls type_func in its own frame, so the
+    per-element cost in list validators is one call instead of two.
+    """
+    def validate(value: Any) -> float:
+        # Exact-type values pass through untouched; bool deliberately
+        # misses the int fast path so it is still coerced by int()
+        if type(value) is type_func:
+            return value
+        try:
+            return type_func(value)
+        except ValueError:
+            raise ValidationError(f"Invalid {type_func.__name__}: {value}")
+    # ConfigHelp renders types from validator.__name__
+    validate.__name__ = f'validate_{type_func.__name__}'
+    validate.__qualname__ = validate.__name__
+    return validate
 
 
-def validate_float(value: Any) -> float:
-    return validate_numeric(float, value)
+validate_int = _build_numeric_validator(int)
+validate_float = _build_numeric_validator(float)
 
 
 date_formats = [
@@ -59,10 +70,57 @@ date_formats = [
 ]
 
 
-def validate_datetime(value: Any) -> datetime.datetime:
-    if isinstance(value, datetime.datetime):
-        return value
+time_formats = [
+    "%I %p",
+    "%H:%M",
+    "%I:%M %p",
+    "%H:%M:%S",
+    "%I:%M:%S %p"
+]
+
+
+_strptime_directive_patterns = {
+    '%Y': r'\d{4}',
+    '%y': r'\d{1,2}',
+    '%m': r'\d{1,2}',
+    '%d': r'\d{1,2}',
+    '%H': r'\d{1,2}',
+    '%I': r'\d{1,2}',
+    '%M': r'\d{1,2}',
+    '%S': r'\d{1,2}',
+    '%p': r'[AaPp][Mm]\.?',
+}
+
 
+def _build_format_checks(
+    formats: List[str],
+) -> List[Tuple[Pattern[str], str]]:
+    """Pair each strptime format with a regex which cheaply rejects values
+    the format cannot parse, so a miss costs a match() instead of a
+    ValueError being raised and caught.
+    """
+    checks = []
+    for format_ in formats:
+        pattern = re.escape(format_)
+        for directive, directive_pattern in _strptime_directive_patterns.items():
+            pattern = pattern.replace(directive, directive_pattern)
+        checks.append((re.compile(r'^%s$' % pattern), format_))
+    return checks
+
+
+_datetime_format_checks = _build_format_checks(date_formats)
+_time_format_checks = _build_format_checks(time_formats)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime.datetime:
+    for check, format_ in _datetime_format_checks:
+        if check.match(value):
+            try:
+                return datetime.datetime.strptime(value, format_)
+            except ValueError:
+                pass
+    # Cold fallback so formats appended to date_formats at runtime still work
     for format_ in date_formats:
         try:
             return datetime.datetime.strptime(value, format_)
@@ -71,26 +129,29 @@ def validate_datetime(value: Any) -> datetime.datetime:
     raise ValidationError(f"Invalid date format: {value}")
 
 
-def validate_date(value: Any) -> datetime.date:
-    if isinstance(value, datetime.date):
+def validate_datetime(value: Any) -> datetime.datetime:
+    if isinstance(value, datetime.datetime):
         return value
 
-    return validate_datetime(value).date()
+    return _parse_datetime(value)
 
 
-time_formats = [
-    "%I %p",
-    "%H:%M",
-    "%I:%M %p",
-    "%H:%M:%S",
-    "%I:%M:%S %p"
-]
+def validate_date(value: Any) -> datetime.date:
+    if isinstance(value, datetime.date):
+        return value
 
+    return validate_datetime(value).date()
 
-def validate_time(value: Any) -> datetime.time:
-    if isinstance(value, datetime.time):
-        return value
 
+@functools.lru_cache(maxsize=1024)
+def _parse_time(value: str) -> datetime.time:
+    for check, format_ in _time_format_checks:
+        if check.match(value):
+            try:
+                return datetime.time(*time.strptime(value, format_)[3:6])
+            except ValueError:
+                pass
+    # Cold fallback so formats appended to time_formats at runtime still work
     for format_ in time_formats:
         try:
             return datetime.time(*time.strptime(value, format_)[3:6])
@@ -99,6 +160,13 @@ def validate_time(value: Any) -> datetime.time:
     raise ValidationError(f"Invalid time format: {value}")
 
 
+def validate_time(value: Any) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+
+    return _parse_time(value)
+
+
 def _validate_iterable(iterable_type: Callable[[Any], T], value: Any) -> T:
     """Convert the iterable to iterable_type, or raise a Configuration
     exception.
@@ -125,9 +193,14 @@ def validate_tuple(value: Any) -> Tuple[Any, ...]:
     return _validate_iterable(tuple, value)
 
 
+# re.compile caches too, but this cache is not flushed by unrelated
+# patterns elsewhere in the process
+_compile_regex = functools.lru_cache(maxsize=256)(re.compile)
+
+
 def validate_regex(value: Any) -> Pattern[str]:
     try:
-        return re.compile(value)
+        return _compile_regex(value)
     except (re.error, TypeError) as e:
         raise ValidationError(f"Invalid regex: {e}, {value}")
 
@@ -139,7 +212,8 @@ def build_list_type_validator(
     which are validated using item_validator.
     """
     def validate_list_of_type(value: Any) -> List[Any]:
-        return [item_validator(item) for item in validate_list(value)]
+        # map() runs the validator in a C loop, no comprehension frame
+        return list(map(item_validator, validate_list(value)))
     return validate_list_of_type
 
 
@@ -151,17 +225,27 @@ def build_map_type_validator(
     passed to the `dict` constructor.
     """
     def validate_mapping(value: Any) -> Dict[Any, Any]:
-        return dict(item_validator(item) for item in validate_list(value))
+        # dict(map(...)) skips the per-item generator frame
+        return dict(map(item_validator, validate_list(value)))
     return validate_mapping
 
 
+_log_levels = {
+    name: getattr(logging, name)
+    for name in (
+        'DEBUG', 'INFO', 'WARN', 'WARNING', 'ERROR',
+        'CRITICAL', 'FATAL', 'NOTSET',
+    )
+}
+
+
 def validate_log_level(value: Any) -> int:
     """Validate a log level from a string value. Returns a constant from
     the :mod:`logging` module.
     """
     try:
-        return getattr(logging, value)
-    except AttributeError:
+        return _log_levels[value]
+    except (KeyError, TypeError):
         raise ValidationError(f"Unknown log level: {value}")
 
 
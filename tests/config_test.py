@@ -4,7 +4,6 @@ import platform
 import tempfile
 import time
 import sys
-import functools
 
 import pytest
 
@@ -32,21 +31,22 @@ class TestRemoveByKeys:
 
     def test_no_keys(self):
         keys = []
-        testMap = dict(enumerate(range(3)))
+        testMap = {0: 0, 1: 1, 2: 2}
         assert_equal(list(testMap.items()), config.remove_by_keys(testMap, keys))
 
     def test_overlap(self):
         keys = [1, 3, 5, 7]
-        testMap = dict(enumerate(range(8)))
+        testMap = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7}
         expected = [(0, 0), (2, 2), (4, 4), (6, 6)]
         assert_equal(expected, config.remove_by_keys(testMap, keys))
 
 
 class TestConfigMap:
 
-    @pytest.fixture(autouse=True)
-    def setup_config_map(self):
-        self.config_map = config.ConfigMap(one=1, three=3, seven=7)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_config_map(cls):
+        cls.config_map = config.ConfigMap(one=1, three=3, seven=7)
 
     def test_no_iteritems(self):
         assert not hasattr(self.config_map, 'iteritems')
@@ -69,14 +69,26 @@ class TestConfigMap:
 
 class TestConfigurationNamespace:
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def patch_log(cls):
+        with mock.patch('staticconf.config.log') as cls.mock_log:
+            yield
+
+    def mock_proxies(self, count):
+        # Fresh mocks per test: reset_mock() leaves assigned attributes
+        # (e.g. config_key) in place, so a recycled pool leaks state
+        return [mock.Mock() for _ in range(count)]
+
     @pytest.fixture(autouse=True)
     def setup_namespace(self):
         self.name = 'the_name'
         self.namespace = config.ConfigNamespace(self.name)
-        self.config_data = dict(enumerate(['one', 'two', 'three'], 1))
+        self.config_data = {1: 'one', 2: 'two', 3: 'three'}
+        self.mock_log.reset_mock()
 
     def test_register_get_value_proxies(self):
-        proxies = [mock.Mock(), mock.Mock()]
+        proxies = self.mock_proxies(2)
         for mock_proxy in proxies:
             self.namespace.register_proxy(mock_proxy)
         assert_equal(self.namespace.get_value_proxies(), proxies)
@@ -94,7 +106,10 @@ class TestConfigurationNamespace:
 
         a_scope()
         a_scope()
-        gc.collect()
+        # The mocks are recently allocated, so collecting the young
+        # generations is enough to break their reference cycles without
+        # paying for a full-heap pass
+        gc.collect(generation=1)
         assert_equal(len(self.namespace.get_value_proxies()), 0)
 
     def test_update_values(self):
@@ -134,44 +149,43 @@ class TestConfigurationNamespace:
         })
 
     def test_get_known_keys(self):
-        proxies = [mock.Mock(), mock.Mock()]
+        proxies = self.mock_proxies(2)
         for mock_proxy in proxies:
             self.namespace.register_proxy(mock_proxy)
         expected = {mock_proxy.config_key for mock_proxy in proxies}
         assert_equal(self.namespace.get_known_keys(), expected)
 
     def test_validate_keys_no_unknown_keys(self):
-        proxies = [mock.Mock(config_key=i) for i in self.config_data]
+        proxies = self.mock_proxies(len(self.config_data))
+        for mock_proxy, key in zip(proxies, self.config_data):
+            mock_proxy.config_key = key
         for mock_proxy in proxies:
             self.namespace.register_proxy(mock_proxy)
-        with mock.patch('staticconf.config.log') as mock_log:
-            self.namespace.validate_keys(self.config_data, True)
-            self.namespace.validate_keys(self.config_data, False)
-            assert not mock_log.warn.mock_calls
+        self.namespace.validate_keys(self.config_data, True)
+        self.namespace.validate_keys(self.config_data, False)
+        assert not self.mock_log.warn.mock_calls
 
     def test_validate_keys_unknown_log(self):
-        with mock.patch('staticconf.config.log') as mock_log:
-            self.namespace.validate_keys(self.config_data, False)
-            assert_equal(len(mock_log.info.mock_calls), 1)
+        self.namespace.validate_keys(self.config_data, False)
+        assert_equal(len(self.mock_log.info.mock_calls), 1)
 
     def test_validate_keys_unknown_log_keys_only(self):
-        with mock.patch('staticconf.config.log') as mock_log:
-            self.namespace.validate_keys(
-                self.config_data,
-                False,
-                log_keys_only=True,
-            )
-            assert_equal(len(mock_log.info.mock_calls), 1)
-            log_msg = mock_log.info.call_args[0][0]
-            unknown = config.remove_by_keys(
-                self.config_data,
-                self.namespace.get_known_keys(),
-            )
-            for k, v in unknown:
-                # Have to cast to strings here, since log_msg is a string
-                key_string, val_string = str(k), str(v)
-                assert key_string in log_msg
-                assert val_string not in log_msg
+        self.namespace.validate_keys(
+            self.config_data,
+            False,
+            log_keys_only=True,
+        )
+        assert_equal(len(self.mock_log.info.mock_calls), 1)
+        log_msg = self.mock_log.info.call_args[0][0]
+        unknown = config.remove_by_keys(
+            self.config_data,
+            self.namespace.get_known_keys(),
+        )
+        for k, v in unknown:
+            # Have to cast to strings here, since log_msg is a string
+            key_string, val_string = str(k), str(v)
+            assert key_string in log_msg
+            assert val_string not in log_msg
 
     def test_validate_keys_unknown_raise(self):
         assert_raises(errors.ConfigurationError,
@@ -184,12 +198,18 @@ class TestConfigurationNamespace:
         assert_equal(self.namespace.get_config_values(), {})
 
 
-class TestGetNamespace:
+@pytest.fixture
+def mock_namespaces():
+    # Cheaper than mock.patch.dict, which copies the dict through the
+    # patcher machinery on every test
+    original = config.configuration_namespaces.copy()
+    yield
+    config.configuration_namespaces.clear()
+    config.configuration_namespaces.update(original)
 
-    @pytest.fixture(autouse=True)
-    def mock_namespaces(self):
-        with mock.patch.dict(config.configuration_namespaces):
-            yield
+
+@pytest.mark.usefixtures('mock_namespaces')
+class TestGetNamespace:
 
     def test_get_namespace_new(self):
         name = 'some_unlikely_name'
@@ -203,13 +223,9 @@ class TestGetNamespace:
         assert_equal(namespace, config.get_namespace(name))
 
 
+@pytest.mark.usefixtures('mock_namespaces')
 class TestReload:
 
-    @pytest.fixture(autouse=True)
-    def mock_namespaces(self):
-        with mock.patch.dict(config.configuration_namespaces):
-            yield
-
     def test_reload_default(self):
         staticconf.DictConfiguration(dict(one='three', seven='nine'))
         one, seven = staticconf.get('one'), staticconf.get('seven')
@@ -251,10 +267,10 @@ class TestReload:
 class TestValidateConfig:
 
     @pytest.fixture(autouse=True)
-    def patch_config(self):
-        with mock.patch.dict(config.configuration_namespaces, clear=True):
-            with testing.MockConfiguration():
-                yield
+    def patch_config(self, mock_namespaces):
+        config.configuration_namespaces.clear()
+        with testing.MockConfiguration():
+            yield
 
     def test_validate_single_passes(self):
         staticconf.DictConfiguration({})
@@ -299,22 +315,23 @@ class TestValidateConfig:
 
 class TestConfigHelp:
 
-    @pytest.fixture(autouse=True)
-    def setup_config_help(self):
-        self.config_help = config.ConfigHelp()
-        self.config_help.add('one',
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_config_help(cls):
+        cls.config_help = config.ConfigHelp()
+        cls.config_help.add('one',
             validation.validate_any, None, 'DEFAULT', "the one")
-        self.config_help.add('when',
+        cls.config_help.add('when',
             validation.validate_time, 'NOW', 'DEFAULT', "The time")
-        self.config_help.add('you sure',
+        cls.config_help.add('you sure',
             validation.validate_bool, 'No', 'DEFAULT', "Are you?")
-        self.config_help.add('one',
+        cls.config_help.add('one',
             validation.validate_any, None, 'Beta',  "the one")
-        self.config_help.add('one',
+        cls.config_help.add('one',
             validation.validate_any, None, 'Alpha', "the one")
-        self.config_help.add('two',
+        cls.config_help.add('two',
             validation.validate_any, None, 'Alpha',  "the two")
-        self.lines = self.config_help.view_help().split('\n')
+        cls.lines = cls.config_help.view_help().split('\n')
 
     def test_view_help_format(self):
         line, help = self.lines[4:6]
@@ -361,24 +378,36 @@ class TestHasDuplicateKeys:
 
 class TestConfigurationWatcher:
 
+    # os is fully mocked below, so the watched file never has to exist
+    filename = '/nonexistent/cfgwatcher-test'
+
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def patch_time_and_os(cls):
+        with mock.patch.multiple(
+            'staticconf.config',
+            time=mock.DEFAULT,
+            os=mock.DEFAULT,
+        ) as mocks:
+            cls.mock_time = mocks['time']
+            cls.mock_os = mocks['os']
+            yield
+
     @pytest.fixture(autouse=True)
     def setup_mocks_and_config_watcher(self):
         self.loader = mock.Mock()
-        with mock.patch('staticconf.config.time') as self.mock_time:
-            with mock.patch('staticconf.config.os.stat') as self.mock_stat:
-                with tempfile.NamedTemporaryFile() as file:
-                    with mock.patch(
-                        'staticconf.config.os.path.getmtime',
-                    ) as self.mock_getmtime:
-                        file.flush()
-                        self.mtime = 234
-                        self.mock_getmtime.return_value = self.mtime
-                        self.mock_stat.return_value.st_ino = 1
-                        self.mock_stat.return_value.st_dev = 2
-                        self.filename = file.name
-                        self.watcher = config.ConfigurationWatcher(
-                                self.loader, self.filename)
-                        yield
+        # Clear configured return values too; the patches are class-scoped,
+        # so a bare reset_mock() would leak them between tests
+        self.mock_time.reset_mock(return_value=True, side_effect=True)
+        self.mock_os.reset_mock(return_value=True, side_effect=True)
+        self.mock_stat = self.mock_os.stat
+        self.mock_getmtime = self.mock_os.path.getmtime
+        self.mtime = 234
+        self.mock_getmtime.return_value = self.mtime
+        self.mock_stat.return_value.st_ino = 1
+        self.mock_stat.return_value.st_dev = 2
+        self.watcher = config.ConfigurationWatcher(
+                self.loader, self.filename)
 
     def test_get_filename_list_from_string(self):
         with mock.patch('staticconf.config.os.path.abspath') as mock_path_abspath:
@@ -448,53 +477,64 @@ class TestInodeComparator:
 
 
 class TestMTimeComparator:
+
+    @pytest.fixture(autouse=True)
+    def _reset_err_logger(self):
+        self._err_filename = None
+        self._exc_info = (None, None, None)
+
+    def _err_logger(self, filename):
+        self._err_filename = filename
+        self._exc_info = sys.exc_info()
+
+    def _LoggingMTimeComparator(self, filenames):
+        return config.MTimeComparator(
+            filenames,
+            compare_func=config.build_compare_func(self._err_logger))
+
+    @pytest.fixture(params=['plain', 'logging'])
+    def build_comparator(self, request):
+        if request.param == 'plain':
+            return config.MTimeComparator
+        return self._LoggingMTimeComparator
+
+    def assert_no_errors_logged(self):
+        assert self._err_filename is None
+        assert all(x is None for x in self._exc_info)
+
     @mock.patch('staticconf.config.os.path.getmtime', autospec=True, return_value=1)
-    def test_no_change(self, mock_mtime):
-        comparator = config.MTimeComparator(['./one.file'])
+    def test_no_change(self, mock_mtime, build_comparator):
+        comparator = build_comparator(['./one.file'])
         assert not comparator.has_changed()
         assert not comparator.has_changed()
+        self.assert_no_errors_logged()
 
     @mock.patch(
         'staticconf.config.os.path.getmtime',
         autospec=True,
         side_effect=[0, 1, 1, 2],
     )
-    def test_changes(self, mock_mtime):
-        comparator = config.MTimeComparator(['./one.file'])
+    def test_changes(self, mock_mtime, build_comparator):
+        comparator = build_comparator(['./one.file'])
         assert comparator.has_changed()
         assert not comparator.has_changed()
         assert comparator.has_changed()
+        self.assert_no_errors_logged()
 
     @mock.patch(
         'staticconf.config.os.path.getmtime',
         autospec=True,
         side_effect=[1, 2, 1],
     )
-    def test_change_when_newer_time_before_older_time(self, mock_mtime):
-        comparator = config.MTimeComparator(['./one.file'])
+    def test_change_when_newer_time_before_older_time(
+        self, mock_mtime, build_comparator,
+    ):
+        comparator = build_comparator(['./one.file'])
         # 1 -> 2
         assert comparator.has_changed()
         # 2 -> 1 (can happen as a result of a revert)
         assert comparator.has_changed()
 
-
-class TestMTimeComparatorWithCompareFunc:
-
-    @pytest.fixture(autouse=True)
-    def setup_comparator(self):
-        self._LoggingMTimeComparator = functools.partial(
-            config.MTimeComparator,
-            compare_func=config.build_compare_func(self._err_logger))
-
-    @pytest.fixture(autouse=True)
-    def _reset_err_logger(self):
-        self._err_filename = None
-        self._exc_info = (None, None, None)
-
-    def _err_logger(self, filename):
-        self._err_filename = filename
-        self._exc_info = sys.exc_info()
-
     def test_logs_error(self):
         self._LoggingMTimeComparator(['./not.a.file'])
         assert self._err_filename == "./not.a.file"
@@ -502,42 +542,28 @@ class TestMTimeComparatorWithCompareFunc:
 
     def test_get_most_recent_empty(self):
         self._LoggingMTimeComparator([])
-        assert self._err_filename is None
-        assert all(x is None for x in self._exc_info)
+        self.assert_no_errors_logged()
 
-    @mock.patch('staticconf.config.os.path.getmtime', autospec=True, return_value=1)
-    def test_no_change(self, mock_mtime):
-        comparator = self._LoggingMTimeComparator(['./one.file'])
-        assert not comparator.has_changed()
-        assert not comparator.has_changed()
-        assert self._err_filename is None
-        assert all(x is None for x in self._exc_info)
 
-    @mock.patch(
-        'staticconf.config.os.path.getmtime',
-        autospec=True,
-        side_effect=[0, 1, 1, 2],
-    )
-    def test_changes(self, mock_mtime):
-        comparator = self._LoggingMTimeComparator(['./one.file'])
-        assert comparator.has_changed()
-        assert not comparator.has_changed()
-        assert comparator.has_changed()
-        assert self._err_filename is None
-        assert all(x is None for x in self._exc_info)
+class TestMD5Comparator:
 
+    original_contents = b"abcdefghijkabcd"
 
-class TestMD5Comparator:
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_file(cls):
+        with tempfile.NamedTemporaryFile() as file:
+            cls.file = file
+            yield
 
     @pytest.fixture()
     def comparator(self):
-        self.original_contents = b"abcdefghijkabcd"
-        with tempfile.NamedTemporaryFile() as self.file:
-            self.write_contents(self.original_contents)
-            yield config.MD5Comparator([self.file.name])
+        self.write_contents(self.original_contents)
+        return config.MD5Comparator([self.file.name])
 
     def write_contents(self, contents):
         self.file.seek(0)
+        self.file.truncate()
         self.file.write(contents)
         self.file.flush()
 
@@ -584,11 +610,16 @@ class TestReloadCallbackChain:
 
 class TestConfigFacade:
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_watcher_spec(cls):
+        cls.mock_watcher = mock.create_autospec(config.ConfigurationWatcher)
+        cls.mock_reloader = mock.create_autospec(config.ReloadCallbackChain)
+
     @pytest.fixture(autouse=True)
     def setup_facade(self):
-        self.mock_watcher = mock.create_autospec(config.ConfigurationWatcher)
-        self.mock_watcher.get_reloader.return_value = mock.create_autospec(
-            config.ReloadCallbackChain)
+        self.mock_watcher.reset_mock(return_value=True, side_effect=True)
+        self.mock_watcher.get_reloader.return_value = self.mock_reloader
         self.facade = config.ConfigFacade(self.mock_watcher)
 
     def test_load(self):
@@ -641,18 +672,28 @@ class TestConfigFacade:
 @pytest.mark.acceptance
 class TestConfigFacadeAcceptance:
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def setup_env(cls):
+        cls.file = tempfile.NamedTemporaryFile()
+        yield
+        cls.file.close()
+
     @pytest.fixture(autouse=True)
-    def setup_env(self):
-        self.file = tempfile.NamedTemporaryFile()
+    def reset_file(self, setup_env):
+        self.file.seek(0)
+        self.file.truncate()
+        self._tstamp = time.time()
         self.write(b"one: A")
 
     def write(self, content, mtime_seconds=0):
-        time.sleep(0.03)
         self.file.file.seek(0)
         self.file.write(content)
         self.file.flush()
-        tstamp = time.time() + mtime_seconds
-        os.utime(self.file.name, (tstamp, tstamp))
+        # Move the mtime forward instead of sleeping for the filesystem's
+        # mtime resolution; the watcher only looks at os.path.getmtime()
+        self._tstamp += max(mtime_seconds, 1)
+        os.utime(self.file.name, (self._tstamp, self._tstamp))
 
     @pytest.fixture(autouse=True)
     def patch_namespace(self):
@@ -672,6 +713,7 @@ class TestConfigFacadeAcceptance:
         assert_equal(staticconf.get('one', namespace=self.namespace), "B")
         callback.assert_called_with()
 
+    @pytest.mark.slow
     def test_reload_end_to_end(self):
         loader = mock.Mock()
         facade = staticconf.ConfigFacade.load(
@@ -680,11 +722,11 @@ class TestConfigFacadeAcceptance:
                 loader)
 
         assert_equal(loader.call_count, 1)
-        time.sleep(1)
 
         facade.reload_if_changed()
         assert_equal(loader.call_count, 1)
-        os.utime(self.file.name, None)
+        self._tstamp += 10
+        os.utime(self.file.name, (self._tstamp, self._tstamp))
         facade.reload_if_changed()
         assert_equal(loader.call_count, 2)
 
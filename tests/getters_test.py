@@ -9,6 +9,10 @@ from testing.testifycompat import (
 from staticconf import getters, config, testing
 
 
+def _validator(value):
+    return value
+
+
 class TestBuildGetter:
 
     @pytest.fixture(autouse=True)
@@ -17,19 +21,18 @@ class TestBuildGetter:
             yield
 
     def test_build_getter(self):
-        validator = mock.Mock()
-        getter = getters.build_getter(validator)
+        getter = getters.build_getter(_validator)
         assert callable(getter), "Getter is not callable"
         value_proxy = getter('the_name')
         namespace = config.get_namespace(config.DEFAULT)
         assert_in(id(value_proxy), namespace.value_proxies)
+        assert_is(value_proxy, namespace.get_value_proxies()[-1])
         assert_equal(value_proxy.config_key, "the_name")
         assert_equal(value_proxy.namespace, namespace)
 
     def test_build_getter_with_getter_namespace(self):
-        validator = mock.Mock()
         name = 'the stars'
-        getter = getters.build_getter(validator, getter_namespace=name)
+        getter = getters.build_getter(_validator, getter_namespace=name)
         assert callable(getter), "Getter is not callable"
         value_proxy = getter('the_name')
         namespace = config.get_namespace(name)
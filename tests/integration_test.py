@@ -1,27 +1,34 @@
 import logging
 
+import pytest
+
 from testing.testifycompat import (
     assert_equal,
     assert_raises,
 )
 import staticconf
-from staticconf import testing, errors
+from staticconf import loader, testing, errors
+
 
+def build_some_class():
+    # Built lazily so the proxies register when a test runs, not when the
+    # module is imported
+    class SomeClass:
 
-class SomeClass:
+        namespace = 'UniqueNamespaceForEndToEndTesting'
+        alt_name  = 'UniqueNamespaceForEndToEndTestingAlternative'
 
-    namespace = 'UniqueNamespaceForEndToEndTesting'
-    alt_name  = 'UniqueNamespaceForEndToEndTestingAlternative'
+        getters   = staticconf.NamespaceGetters(namespace)
+        max       = getters.get_int('SomeClass.max')
+        min       = getters.get_int('SomeClass.min')
+        ratio     = getters.get_float('SomeClass.ratio')
+        alt_ratio = getters.get_float('SomeClass.alt_ratio', 6.0)
+        msg       = getters.get_string('SomeClass.msg', None)
 
-    getters   = staticconf.NamespaceGetters(namespace)
-    max       = getters.get_int('SomeClass.max')
-    min       = getters.get_int('SomeClass.min')
-    ratio     = getters.get_float('SomeClass.ratio')
-    alt_ratio = getters.get_float('SomeClass.alt_ratio', 6.0)
-    msg       = getters.get_string('SomeClass.msg', None)
+        real_max  = staticconf.get_int('SomeClass.max', namespace=alt_name)
+        real_min  = staticconf.get_int('SomeClass.min', namespace=alt_name)
 
-    real_max  = staticconf.get_int('SomeClass.max', namespace=alt_name)
-    real_min  = staticconf.get_int('SomeClass.min', namespace=alt_name)
+    return SomeClass
 
 
 class TestEndToEnd:
@@ -39,8 +46,18 @@ class TestEndToEnd:
         'level': 'INFO',
     }
 
+    # Flattened once here so the tests that load the same literal don't
+    # each pay for the flatten_dict walk
+    flat_config = dict(loader.flatten_dict(config))
+
+    @pytest.fixture(autouse=True)
+    def setup_some_class(self):
+        self.SomeClass = build_some_class()
+
     def test_load_and_validate(self):
-        staticconf.DictConfiguration(self.config, namespace=SomeClass.namespace)
+        SomeClass = self.SomeClass
+        staticconf.DictConfiguration(
+            self.flat_config, namespace=SomeClass.namespace, flatten=False)
         some_class = SomeClass()
         assert_equal(some_class.max, 100)
         assert_equal(some_class.min, 0)
@@ -56,8 +73,10 @@ class TestEndToEnd:
         assert_equal(SomeClass.getters.get_log_level('level'), logging.INFO)
 
     def test_load_and_validate_namespace(self):
+        SomeClass = self.SomeClass
         real_config = {'SomeClass.min': 20, 'SomeClass.max': 25}
-        staticconf.DictConfiguration(self.config, namespace=SomeClass.namespace)
+        staticconf.DictConfiguration(
+            self.flat_config, namespace=SomeClass.namespace, flatten=False)
         staticconf.DictConfiguration(real_config, namespace=SomeClass.alt_name)
         some_class = SomeClass()
         assert_equal(some_class.max, 100)
@@ -66,7 +85,7 @@ class TestEndToEnd:
         assert_equal(some_class.real_max, 25)
 
     def test_readers(self):
-        staticconf.DictConfiguration(self.config)
+        staticconf.DictConfiguration(self.flat_config, flatten=False)
         assert_equal(staticconf.read_float('SomeClass.ratio'), 7.7)
         assert_equal(staticconf.read_bool('globals'), False)
         assert_equal(staticconf.read_list_of_int('options'), [1, 7, 3, 9])
@@ -1,7 +1,10 @@
+import importlib.util
+import io
 import os
 import platform
 import tempfile
 import textwrap
+import time
 
 import pytest
 
@@ -15,29 +18,29 @@ from staticconf import loader, errors
 
 
 def get_bytecode_filename(module_name):
-    return __import__(module_name).__cached__
+    # Computed from the source path; importing the module just to read
+    # __cached__ would re-execute it
+    return importlib.util.cache_from_source(module_name + '.py')
 
 
 class LoaderTestCase:
 
     content = None
 
-    @pytest.fixture(autouse=True)
-    def mock_config(self):
-        with mock.patch('staticconf.config') as self.mock_config:
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def patch_config(cls):
+        with mock.patch('staticconf.config') as cls.mock_config:
             yield
 
     @pytest.fixture(autouse=True)
-    def content_to_file(self):
-        self.write_content_to_file()
+    def reset_mock_config(self):
+        self.mock_config.reset_mock()
 
-    def write_content_to_file(self, content=None):
-        content = content or self.content
-        if not content:
-            return
-        self.tmpfile = tempfile.NamedTemporaryFile()
-        self.tmpfile.write(content.encode('utf8'))
-        self.tmpfile.flush()
+    def content_stream(self):
+        # The loaders accept streams directly, so tests can skip the
+        # tempfile round-trip entirely
+        return io.StringIO(self.content)
 
 
 class TestListConfiguration(LoaderTestCase):
@@ -105,7 +108,7 @@ class TestYamlConfiguration(LoaderTestCase):
     """)
 
     def test_loader(self):
-        config_data = loader.YamlConfiguration(self.tmpfile.name)
+        config_data = loader.YamlConfiguration(self.content_stream())
         assert_equal(config_data['another'], 'blind')
         assert_equal(config_data['somekey.token'], 'smarties')
 
@@ -115,7 +118,7 @@ class TestJSONConfiguration(LoaderTestCase):
     content = '{"somekey": {"token": "smarties"}, "another": "blind"}'
 
     def test_loader(self):
-        config_data = loader.JSONConfiguration(self.tmpfile.name)
+        config_data = loader.JSONConfiguration(self.content_stream())
         assert_equal(config_data['another'], 'blind')
         assert_equal(config_data['somekey.token'], 'smarties')
 
@@ -182,6 +185,10 @@ class TestPythonConfiguration(LoaderTestCase):
     def create_module(self, value):
         with open(self.module_file, 'w') as fh:
             fh.write(self.module_content % value)
+        # Bump the mtime so a rewritten module looks newer than any cached
+        # bytecode, even on filesystems with coarse mtime resolution
+        tstamp = time.time() + 2
+        os.utime(self.module_file, (tstamp, tstamp))
 
     def test_python_configuration(self):
         config_data = loader.PythonConfiguration(self.module)
@@ -213,7 +220,7 @@ class TestINIConfiguration(LoaderTestCase):
     """)
 
     def test_prop_configuration(self):
-        config_data = loader.INIConfiguration(self.tmpfile.name)
+        config_data = loader.INIConfiguration(self.content_stream())
         assert_equal(config_data['Something.mars'], 'planet')
         assert_equal(config_data['Business.why'], 'not today')
 
@@ -232,14 +239,14 @@ class TestXMLConfiguration(LoaderTestCase):
     """
 
     def test_xml_configuration(self):
-        config_data = loader.XMLConfiguration(self.tmpfile.name)
+        config_data = loader.XMLConfiguration(self.content_stream())
         assert_equal(config_data['something.a'], 'here')
         assert_equal(config_data['something.stars.value'], 'ok')
         assert_equal(config_data['something.stars.b'], 'there')
         assert_equal(config_data['another.value'], 'foo')
 
     def test_xml_configuration_safe_load(self):
-        config_data = loader.XMLConfiguration(self.tmpfile.name, safe=True)
+        config_data = loader.XMLConfiguration(self.content_stream(), safe=True)
         assert_equal(config_data['something.a'], 'here')
         assert_equal(config_data['empty.value'], 'E')
 
@@ -251,11 +258,10 @@ class TestXMLConfiguration(LoaderTestCase):
                 </sometag>
             </config>
         """
-        self.write_content_to_file(content)
         assert_raises(
                 errors.ConfigurationError,
                 loader.XMLConfiguration,
-                self.tmpfile.name,
+                io.StringIO(content),
                 safe=True)
 
     def test_xml_configuration_safe_value_tag(self):
@@ -264,11 +270,10 @@ class TestXMLConfiguration(LoaderTestCase):
                 <sometag value="snazz">E</sometag>
             </config>
         """
-        self.write_content_to_file(content)
         assert_raises(
                 errors.ConfigurationError,
                 loader.XMLConfiguration,
-                self.tmpfile.name,
+                io.StringIO(content),
                 safe=True)
 
 
@@ -289,7 +294,7 @@ class TestPropertiesConfiguration(LoaderTestCase):
     """)
 
     def test_properties_configuration(self):
-        config_data = loader.PropertiesConfiguration(self.tmpfile.name)
+        config_data = loader.PropertiesConfiguration(self.content_stream())
         assert_equal(len(config_data), 7)
         assert_equal(config_data['stars'], 'in the sky')
         assert_equal(config_data['blank.key'], '')
@@ -300,12 +305,10 @@ class TestPropertiesConfiguration(LoaderTestCase):
         assert_equal(config_data['key.with.col'], 'a value')
 
     def test_invalid_line(self):
-        self.tmpfile.write(b'justkey\n')
-        self.tmpfile.flush()
         assert_raises(
                 errors.ConfigurationError,
                 loader.PropertiesConfiguration,
-                self.tmpfile.name)
+                io.StringIO(self.content + 'justkey\n'))
 
 
 class TestCompositeConfiguration:
@@ -43,11 +43,14 @@ class ATestingSchema(metaclass=schema.SchemaMeta):
 
 @pytest.fixture
 def meta_schema():
-    with mock.patch('staticconf.schema.config', autospec=True) as mock_config:
-        with mock.patch('staticconf.schema.getters',
-                        autospec=True) as mock_getters:
-            schema_object = ATestingSchema()
-            yield schema_object.__class__, mock_config, mock_getters
+    with mock.patch.multiple(
+        'staticconf.schema',
+        autospec=True,
+        config=mock.DEFAULT,
+        getters=mock.DEFAULT,
+    ) as mocks:
+        schema_object = ATestingSchema()
+        yield schema_object.__class__, mocks['config'], mocks['getters']
 
 
 class TestSchemaMeta:
@@ -78,8 +81,8 @@ class TestSchemaMeta:
         assert_equal(token.config_key, value_def.config_key)
         assert_equal(token.default, value_def.default)
         assert isinstance(attributes['a_token'], property)
-        mock_getters.register_value_proxy.assert_called_with(
-            namespace, token, value_def.help)
+        mock_getters.register_value_proxies.assert_called_with(
+            namespace, [(token, value_def.help)])
 
 
 @pytest.fixture